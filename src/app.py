@@ -7,8 +7,8 @@ for extracurricular activities at Mergington High School.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
-import os
+from fastapi.responses import RedirectResponse, Response
+import orjson
 from pathlib import Path
 
 app = FastAPI(title="Mergington High School API",
@@ -16,8 +16,7 @@ app = FastAPI(title="Mergington High School API",
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
+app.mount("/static", StaticFiles(directory=current_dir / "static"), name="static")
 
 # In-memory activity database
 activities = {
@@ -41,27 +40,49 @@ activities = {
     }
 }
 
+# Serialized /activities body, rebuilt lazily on the next read. Any code that
+# changes `activities` must call _invalidate_activities_cache(). This relies on
+# the handlers running on the event loop (async def) with no await between a
+# mutation and the reset.
+_activities_json = None
+
+
+def _invalidate_activities_cache():
+    global _activities_json
+    _activities_json = None
+
 
 @app.get("/")
-def root():
+async def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+async def get_activities():
+    global _activities_json
+    if _activities_json is None:
+        _activities_json = orjson.dumps(activities)
+    return Response(content=_activities_json, media_type="application/json")
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
+    # Get the specific activity and validate it exists
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specificy activity
-    activity = activities[activity_name]
-
     # Add student
     activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+    _invalidate_activities_cache()
+    message = {"message": f"Signed up {email} for {activity_name}"}
+    return Response(content=orjson.dumps(message), media_type="application/json")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Single worker: activities live in process memory, so extra workers
+    # would each hold their own copy of the signups
+    uvicorn.run(app, host="0.0.0.0", port=8000)